@@ -1,4 +1,5 @@
 import aiohttp
+import httpx
 import requests
 from web3.exceptions import (
     BadFunctionCallOutput,
@@ -32,10 +33,68 @@ from web3.exceptions import (
     MethodUnavailable,
 )
 
+__all__ = ["ErrorHandler"]
+
+
+_ERROR_MAP = {
+    ProviderConnectionError: "connection_to_node",
+    aiohttp.ClientConnectionError: "connection_to_node",
+    aiohttp.ClientResponseError: "connection_to_node",
+    aiohttp.ClientPayloadError: "connection_to_node",
+    aiohttp.ClientOSError: "connection_to_node",
+    aiohttp.InvalidURL: "connection_to_node",
+    requests.exceptions.ConnectionError: "connection_to_node",
+    requests.exceptions.Timeout: "connection_to_node",
+    httpx.TransportError: "connection_to_node",
+    httpx.HTTPStatusError: "connection_to_node",
+    UnicodeError: "connection_to_node",
+    InvalidAddress: "invalid_address",
+    Web3ValidationError: "validation",
+    BadFunctionCallOutput: "bad_function_call_output",
+    InvalidEventABI: "invalid_event_abi",
+    ABIFunctionNotFound: "abi_function_not_found",
+    ABIEventFunctionNotFound: "abi_event_function_not_found",
+    MismatchedABI: "mismatched_abi",
+    FallbackNotFound: "fallback_not_found",
+    LogTopicError: "log_topic_error",
+    BlockNumberOutofRange: "block_number_out_of_range",
+    BlockNotFound: "block_not_found",
+    TransactionNotFound: "transaction_not_found",
+    NameNotFound: "name_not_found",
+    StaleBlockchain: "stale_blockchain",
+    CannotHandleRequest: "cannot_handle_request",
+    TooManyRequests: "too_many_requests",
+    MultipleFailedRequests: "multiple_failed_requests",
+    MethodUnavailable: "method_unavailable",
+    ContractLogicError: "contract_logic_error",
+    TimeExhausted: "time_exhausted",
+    ExtraDataLengthError: "extra_data_length_error",
+    NoABIFunctionsFound: "no_abi_functions_found",
+    NoABIFound: "no_abi_found",
+    NoABIEventsFound: "no_abi_events_found",
+    InsufficientData: "insufficient_data",
+    InvalidTransaction: "invalid_transaction",
+    TransactionTypeMismatch: "transaction_type_mismatch",
+    BadResponseFormat: "bad_response_format",
+}
+"""dict:
+    Maps exception types to their classification. Subclasses are resolved by walking the exception's MRO, so the 
+    most specific registered type wins.
+"""
+
+_VALUE_ERROR_FRAGMENTS = (
+    ("when sending a str, it must be a hex string", "invalid_address_format"),
+    ("Unknown format", "invalid_address_format"),
+    ("Could not format invalid value", "abi_error"),
+)
+"""tuple:
+    Message fragments that classify a plain ValueError, checked in order.
+"""
+
 
 class ErrorHandler:
     """
-    ErrorHandler class to classify and get messages for errors occurring in web3.py and aiohttp.
+    ErrorHandler class to classify and get messages for errors occurring in web3.py and the HTTP clients.
 
     Methods
     -------
@@ -61,111 +120,19 @@ class ErrorHandler:
         str
             The classification of the error.
         """
-        match error:
-            case (ProviderConnectionError() | aiohttp.ClientConnectionError() |
-                  aiohttp.ClientResponseError() | aiohttp.ClientPayloadError() |
-                  aiohttp.ClientOSError() | aiohttp.InvalidURL() |
-                  requests.exceptions.ConnectionError() | requests.exceptions.Timeout()):
-                return "connection_to_node"
-
-            case InvalidAddress():
-                return "invalid_address"
-
-            case ValueError() if "when sending a str, it must be a hex string" in str(error):
-                return "invalid_address_format"
-
-            case ValueError() if "Unknown format" in str(error):
-                return "invalid_address_format"
-
-            case Web3ValidationError():
-                return "validation"
-
-            case BadFunctionCallOutput():
-                return "bad_function_call_output"
-
-            case InvalidEventABI():
-                return "invalid_event_abi"
-
-            case ABIFunctionNotFound():
-                return "abi_function_not_found"
-
-            case ABIEventFunctionNotFound():
-                return "abi_event_function_not_found"
-
-            case MismatchedABI():
-                return "mismatched_abi"
-
-            case ValueError() if "Could not format invalid value" in str(error):
-                return "abi_error"
-
-            case FallbackNotFound():
-                return "fallback_not_found"
-
-            case LogTopicError():
-                return "log_topic_error"
-
-            case BlockNumberOutofRange():
-                return "block_number_out_of_range"
-
-            case BlockNotFound():
-                return "block_not_found"
-
-            case TransactionNotFound():
-                return "transaction_not_found"
-
-            case NameNotFound():
-                return "name_not_found"
-
-            case StaleBlockchain():
-                return "stale_blockchain"
-
-            case CannotHandleRequest():
-                return "cannot_handle_request"
-
-            case TooManyRequests():
-                return "too_many_requests"
-
-            case MultipleFailedRequests():
-                return "multiple_failed_requests"
-
-            case MethodUnavailable():
-                return "method_unavailable"
-
-            case ContractLogicError():
-                return "contract_logic_error"
-
-            case TimeExhausted():
-                return "time_exhausted"
-
-            case ExtraDataLengthError():
-                return "extra_data_length_error"
-
-            case NoABIFunctionsFound():
-                return "no_abi_functions_found"
-
-            case NoABIFound():
-                return "no_abi_found"
-
-            case NoABIEventsFound():
-                return "no_abi_events_found"
-
-            case InsufficientData():
-                return "insufficient_data"
-
-            case InvalidTransaction():
-                return "invalid_transaction"
-
-            case TransactionTypeMismatch():
-                return "transaction_type_mismatch"
-
-            case BadResponseFormat():
-                return "bad_response_format"
+        error_type = type(error)
+        for cls in error_type.__mro__:
+            tag = _ERROR_MAP.get(cls)
+            if tag is not None:
+                return tag
 
-            case UnicodeError():
-                return "connection_to_node"
+        if isinstance(error, ValueError):
+            message = error.args[0] if error.args and isinstance(error.args[0], str) else str(error)
+            for fragment, tag in _VALUE_ERROR_FRAGMENTS:
+                if fragment in message:
+                    return tag
 
-            case _:
-                return "unknown"
+        return "unknown"
 
     @staticmethod
     def get_error_message(error: Exception) -> str:
@@ -182,5 +149,5 @@ class ErrorHandler:
         str
             The descriptive error message.
         """
-        error_message = str(error) if str(error) else "*no detailed info is provided*"
+        error_message = str(error) or "*no detailed info is provided*"
         return f"{type(error).__name__}: {error_message}"
@@ -1,7 +1,60 @@
 import asyncio
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from error_handling import ErrorHandler
-from read_balances import BalanceReader
+from read_balances import (
+    BALANCE_OF_SELECTOR,
+    DECIMALS_SELECTOR,
+    GET_ETH_BALANCE_SELECTOR,
+    MULTICALL3_ADDRESS,
+    SYMBOL_SELECTOR,
+    BalanceReader,
+    MulticallReader,
+    checksum_address,
+    encode_address_call,
+    get_known_token_metadata,
+    to_units,
+)
+
+
+class RateLimiter:
+    """
+    An asynchronous rate limiter that spaces out entries by a fixed interval.
+
+    Attributes
+    ----------
+    interval : float
+        The minimum time in seconds between two consecutive entries.
+
+    Methods
+    -------
+    __aenter__():
+        Waits until the next slot is available.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """
+        Initializes the RateLimiter with an interval.
+
+        Parameters
+        ----------
+        interval : float
+            The minimum time in seconds between two consecutive entries.
+        """
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_slot = max(now, self._next_slot) + self.interval
+
+    async def __aexit__(self, exc_type: Optional[type], exc: Optional[BaseException], tb: Any) -> None:
+        return None
 
 
 class AsyncBalanceFetcher:
@@ -12,10 +65,12 @@ class AsyncBalanceFetcher:
     ----------
     reader : BalanceReader
         The BalanceReader instance to read balances from.
+    multicall : MulticallReader
+        The MulticallReader instance to batch balance calls with.
     delay : float
         The delay between balance fetches to avoid node throttling.
-    token_abi : str
-        The ABI of the custom token contracts.
+    max_concurrent : int
+        The maximum number of wallets fetched at the same time.
 
     Methods
     -------
@@ -23,12 +78,15 @@ class AsyncBalanceFetcher:
         Fetches balances for a single wallet address.
 
     fetch_all_balances(wallet_addresses, token_addresses):
-        Fetches balances for multiple wallet addresses.
+        Fetches balances for multiple wallet addresses, batching calls through Multicall3 when it is available.
+
+    close():
+        Releases the connection to the node, closing it once no other fetcher for the same node uses it.
     """
 
-    def __init__(self, node_url: str, delay: float, token_abi: str) -> None:
+    def __init__(self, node_url: str, delay: float, max_concurrent: int = 10) -> None:
         """
-        Initializes the AsyncBalanceFetcher with a node URL, delay, and token ABI.
+        Initializes the AsyncBalanceFetcher with a node URL, delay, and concurrency limit.
 
         Parameters
         ----------
@@ -36,12 +94,15 @@ class AsyncBalanceFetcher:
             The URL of the Ethereum node to connect to.
         delay : float
             The delay between balance fetches to avoid node throttling.
-        token_abi : str
-            The ABI of the custom token contracts.
+        max_concurrent : int, optional
+            The maximum number of wallets fetched at the same time (default is 10).
         """
         self.reader = BalanceReader(node_url)
+        self.multicall = MulticallReader(self.reader.web3)
         self.delay = delay
-        self.token_abi = token_abi
+        self.max_concurrent = max_concurrent
+        self._limiter = RateLimiter(delay)
+        self._sem = asyncio.Semaphore(max_concurrent)
 
     async def fetch_balances_for_wallet(self, wallet_address: str, token_addresses: List[str]) -> Dict[str, Any]:
         """
@@ -59,66 +120,154 @@ class AsyncBalanceFetcher:
         dict
             A dictionary containing the wallet address, native balance, token balances, and errors if any.
         """
-        try:
-            native_balance = await self.reader.get_native_token_balance(wallet_address)
-            if isinstance(native_balance, tuple):
-                native_balance, native_error_type, native_error_message = native_balance
-            else:
-                native_error_type = None
-                native_error_message = None
-
-            if native_balance is not None:
-                token_balances = {}
-                errors = {}
-                for token_address in token_addresses:
-                    balance_result = await self.reader.get_custom_token_balance(token_address, self.token_abi,
-                                                                                wallet_address)
-                    if isinstance(balance_result, tuple) and len(balance_result) == 4:
-                        balance, symbol, error_type, error_message = balance_result
-                        if balance is not None and symbol is not None:
-                            token_balances[symbol] = balance
+        async with self._sem, self._limiter:
+            try:
+                native_balance, token_results = await asyncio.gather(
+                    self.reader.get_native_token_balance(wallet_address),
+                    asyncio.gather(
+                        *(self.reader.get_custom_token_balance(token_address, wallet_address)
+                          for token_address in token_addresses)
+                    )
+                )
+                if isinstance(native_balance, tuple):
+                    native_balance, native_error_type, native_error_message = native_balance
+                else:
+                    native_error_type = None
+                    native_error_message = None
+
+                if native_balance is not None:
+                    token_balances = {}
+                    errors = {}
+                    for token_address, balance_result in zip(token_addresses, token_results):
+                        if isinstance(balance_result, tuple) and len(balance_result) == 4:
+                            balance, symbol, error_type, error_message = balance_result
+                            if balance is not None and symbol is not None:
+                                token_balances[symbol] = balance
+                            else:
+                                errors[token_address] = {"error_type": error_type, "message": error_message}
                         else:
-                            errors[token_address] = {"error_type": error_type, "message": error_message}
-                    else:
-                        balance, symbol = balance_result
-                        token_balances[symbol] = balance
+                            balance, symbol = balance_result
+                            token_balances[symbol] = balance
 
-                if errors:
-                    return {
-                        'wallet_address': wallet_address,
-                        'native_balance': native_balance,
-                        'token_balances': token_balances,
-                        'errors': errors
-                    }
+                    if errors:
+                        return {
+                            'wallet_address': wallet_address,
+                            'native_balance': native_balance,
+                            'token_balances': token_balances,
+                            'errors': errors
+                        }
+                    else:
+                        return {
+                            'wallet_address': wallet_address,
+                            'native_balance': native_balance,
+                            'token_balances': token_balances
+                        }
                 else:
                     return {
                         'wallet_address': wallet_address,
-                        'native_balance': native_balance,
-                        'token_balances': token_balances
+                        'error': {
+                            'type': native_error_type,
+                            'message': native_error_message
+                        }
                     }
-            else:
+
+            except Exception as e:
+                error_type = ErrorHandler.classify_error(e)
+                error_message = ErrorHandler.get_error_message(e)
                 return {
                     'wallet_address': wallet_address,
                     'error': {
-                        'type': native_error_type,
-                        'message': native_error_message
+                        'type': error_type,
+                        'message': error_message
                     }
                 }
 
+    async def fetch_all_balances(self, wallet_addresses: List[str], token_addresses: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetches balances for multiple wallet addresses, batching calls through Multicall3 when it is available.
+
+        Parameters
+        ----------
+        wallet_addresses : list of str
+            The list of wallet addresses to fetch balances for.
+        token_addresses : list of str
+            The list of custom token addresses to check balances for.
+
+        Returns
+        -------
+        list of dict
+            A list of dictionaries containing balances and errors for each wallet address.
+        """
+        try:
+            if await self.multicall.is_available():
+                return await self._fetch_all_balances_multicall(wallet_addresses, token_addresses)
         except Exception as e:
-            error_type = ErrorHandler.classify_error(e)
-            error_message = ErrorHandler.get_error_message(e)
-            return {
-                'wallet_address': wallet_address,
-                'error': {
-                    'type': error_type,
-                    'message': error_message
-                }
-            }
+            print(f"Multicall3 batching failed, falling back to per-wallet requests: "
+                  f"{ErrorHandler.get_error_message(e)}")
 
-    async def fetch_all_balances(self, wallet_addresses: List[str], token_addresses: List[str]) -> List[Dict[str, Any]]:
+        return await self._fetch_all_balances_per_wallet(wallet_addresses, token_addresses)
+
+    async def close(self) -> None:
+        """
+        Releases the connection to the node, closing it once no other fetcher for the same node uses it.
         """
-        Fetches balances for multiple wallet addresses.
+        await self.reader.close()
+
+    @staticmethod
+    async def _wait_all(tasks: List[asyncio.Task], progress_label: str) -> None:
+        """
+        Waits for all tasks, reporting progress as they complete. If one of them fails or the wait is cancelled, the 
+        remaining tasks are cancelled and awaited before the exception is re-raised.
+
+        Parameters
+        ----------
+        tasks : list of asyncio.Task
+            The tasks to wait for.
+        progress_label : str
+            The prefix of the progress line printed after each completed task.
+
+        Raises
+        ------
+        BaseException
+            The first exception raised by a task or by the wait itself.
+        """
+        total = len(tasks)
+        try:
+            for completed, future in enumerate(asyncio.as_completed(tasks), 1):
+                await future
+                print(f"{progress_label}: {completed}/{total}")
+        except BaseException:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _aggregate_chunk(self, calls: List[Tuple[str, bytes]]) -> List[Tuple[bool, bytes]]:
+        """
+        Executes a chunk of calls through Multicall3, respecting the rate limiter and concurrency limit.
+
+        Parameters
+        ----------
+        calls : list of tuple
+            A list of (target address, calldata) pairs.
+
+        Returns
+        -------
+        list of tuple
+            A list of (success, return data) pairs in the order of the submitted calls.
+        """
+        async with self._sem, self._limiter:
+            return await self.multicall.aggregate(calls)
+
+    async def _fetch_all_balances_multicall(self, wallet_addresses: List[str],
+                                            token_addresses: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetches balances for multiple wallet addresses by batching every call into Multicall3 aggregate3 requests.
+
+        Token metadata missing from the registry is requested once per token, followed by the native balance and 
+        the balanceOf call of every token for each wallet. The call matrix is split into chunks of at most 
+        chunk_size calls, and the results are mapped back to per-wallet dictionaries in the order of the input.
 
         Parameters
         ----------
@@ -131,26 +280,136 @@ class AsyncBalanceFetcher:
         -------
         list of dict
             A list of dictionaries containing balances and errors for each wallet address.
+
+        Raises
+        ------
+        Exception
+            If a Multicall3 request fails as a whole, so that the caller can fall back to per-wallet requests.
         """
-        tasks = []
-        total_wallets = len(wallet_addresses)
-        for idx, wallet_address in enumerate(wallet_addresses):
-            tasks.append(self.fetch_balances_for_wallet(wallet_address, token_addresses))
-            await asyncio.sleep(self.delay)
-            print(f"Received wallet balances: {idx + 1}/{total_wallets}")
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        final_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                error_type = ErrorHandler.classify_error(result)
-                error_message = ErrorHandler.get_error_message(result)
-                final_results.append({
+        checksum_tokens = {}
+        token_meta = {}
+        for token_address in token_addresses:
+            try:
+                checksum_tokens[token_address] = checksum_address(token_address)
+            except Exception as e:
+                token_meta[token_address] = {
+                    "error_type": ErrorHandler.classify_error(e),
+                    "message": ErrorHandler.get_error_message(e)
+                }
+        checksum_wallets = []
+        wallet_errors = {}
+        for wallet_address in wallet_addresses:
+            try:
+                checksum_wallets.append(checksum_address(wallet_address))
+            except Exception as e:
+                wallet_errors[wallet_address] = {
+                    'type': ErrorHandler.classify_error(e),
+                    'message': ErrorHandler.get_error_message(e)
+                }
+
+        chain_id = await self.reader.get_chain_id()
+        unknown_tokens = {}
+        for token_address, checksum_token_address in checksum_tokens.items():
+            known_meta = get_known_token_metadata(chain_id, checksum_token_address)
+            if known_meta is not None:
+                token_meta[token_address] = known_meta
+            else:
+                unknown_tokens[token_address] = checksum_token_address
+
+        # The call matrix is laid out as: decimals and symbol for every token missing from the registry, then for
+        # every wallet its native balance followed by the balanceOf call of every token. Results are read back in the
+        # same order.
+        calls = []
+        for checksum_token_address in unknown_tokens.values():
+            calls.append((checksum_token_address, DECIMALS_SELECTOR))
+            calls.append((checksum_token_address, SYMBOL_SELECTOR))
+        for checksum_wallet_address in checksum_wallets:
+            calls.append((MULTICALL3_ADDRESS, encode_address_call(GET_ETH_BALANCE_SELECTOR, checksum_wallet_address)))
+            for checksum_token_address in checksum_tokens.values():
+                calls.append((checksum_token_address, encode_address_call(BALANCE_OF_SELECTOR, checksum_wallet_address)))
+
+        chunk_size = self.multicall.chunk_size
+        chunks = [calls[idx:idx + chunk_size] for idx in range(0, len(calls), chunk_size)]
+        tasks = [asyncio.create_task(self._aggregate_chunk(chunk)) for chunk in chunks]
+        await self._wait_all(tasks, "Received multicall batches")
+        call_results = iter([result for task in tasks for result in task.result()])
+
+        for token_address in unknown_tokens:
+            decimals_result, symbol_result = next(call_results), next(call_results)
+            try:
+                token_meta[token_address] = (MulticallReader.decode(decimals_result, "uint8"),
+                                             MulticallReader.decode(symbol_result, "string"))
+            except Exception as e:
+                token_meta[token_address] = {
+                    "error_type": ErrorHandler.classify_error(e),
+                    "message": ErrorHandler.get_error_message(e)
+                }
+
+        results = []
+        for wallet_address in wallet_addresses:
+            if wallet_address in wallet_errors:
+                results.append({'wallet_address': wallet_address, 'error': wallet_errors[wallet_address]})
+                continue
+
+            native_result = next(call_results)
+            balance_results = {token_address: next(call_results) for token_address in checksum_tokens}
+            try:
+                native_balance = to_units(MulticallReader.decode(native_result, "uint256"), 18)
+            except Exception as e:
+                results.append({
+                    'wallet_address': wallet_address,
                     'error': {
-                        'type': error_type,
-                        'message': error_message
+                        'type': ErrorHandler.classify_error(e),
+                        'message': ErrorHandler.get_error_message(e)
                     }
                 })
-            else:
-                final_results.append(result)
-        return final_results
+                continue
+
+            token_balances = {}
+            errors = {}
+            for token_address in token_addresses:
+                meta = token_meta[token_address]
+                if isinstance(meta, dict):
+                    errors[token_address] = meta
+                    continue
+                token_decimals, token_symbol = meta
+                try:
+                    balance_of_token = MulticallReader.decode(balance_results[token_address], "uint256")
+                    token_balances[token_symbol] = to_units(balance_of_token, token_decimals)
+                except Exception as e:
+                    errors[token_address] = {
+                        "error_type": ErrorHandler.classify_error(e),
+                        "message": ErrorHandler.get_error_message(e)
+                    }
+
+            result = {
+                'wallet_address': wallet_address,
+                'native_balance': native_balance,
+                'token_balances': token_balances
+            }
+            if errors:
+                result['errors'] = errors
+            results.append(result)
+        return results
+
+    async def _fetch_all_balances_per_wallet(self, wallet_addresses: List[str],
+                                             token_addresses: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetches balances for multiple wallet addresses with separate requests for every wallet.
+
+        Parameters
+        ----------
+        wallet_addresses : list of str
+            The list of wallet addresses to fetch balances for.
+        token_addresses : list of str
+            The list of custom token addresses to check balances for.
+
+        Returns
+        -------
+        list of dict
+            A list of dictionaries containing balances and errors for each wallet address.
+        """
+        tasks = [asyncio.create_task(self.fetch_balances_for_wallet(wallet_address, token_addresses))
+                 for wallet_address in wallet_addresses]
+        await self._wait_all(tasks, "Received wallet balances")
+        return [task.result() for task in tasks]
@@ -0,0 +1,111 @@
+import httpx
+import orjson
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Converts values orjson cannot serialize natively into JSON-RPC compatible ones.
+
+    Parameters
+    ----------
+    obj : Any
+        The value to convert.
+
+    Returns
+    -------
+    Any
+        A hex string for bytes-like values, or a plain dict for mappings such as AttributeDict.
+    """
+    if isinstance(obj, (bytes, bytearray)):
+        return "0x" + bytes(obj).hex()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class HttpxAsyncProvider(AsyncHTTPProvider):
+    """
+    An asynchronous HTTP provider sending JSON-RPC requests over a single HTTP/2 connection using httpx. Request 
+    kwargs are forwarded to httpx.AsyncClient.post, so they must be httpx arguments such as headers or timeout.
+
+    Attributes
+    ----------
+    endpoint_uri : str
+        The URL of the Ethereum node to connect to.
+
+    Methods
+    -------
+    make_request(method, params):
+        Sends a JSON-RPC request to the node.
+
+    disconnect():
+        Closes the underlying HTTP client.
+    """
+
+    def __init__(self, endpoint_uri: str, timeout: float = 30.0,
+                 request_kwargs: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Initializes the HttpxAsyncProvider with a node URL, request timeout, and extra request kwargs.
+
+        Parameters
+        ----------
+        endpoint_uri : str
+            The URL of the Ethereum node to connect to.
+        timeout : float, optional
+            The timeout of a single request in seconds (default is 30).
+        request_kwargs : dict, optional
+            Extra keyword arguments passed to httpx.AsyncClient.post. Headers default to get_request_headers().
+        """
+        super().__init__(endpoint_uri, request_kwargs)
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
+        return self._client
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """
+        Sends a JSON-RPC request to the node.
+
+        Parameters
+        ----------
+        method : str
+            The JSON-RPC method to call.
+        params : Any
+            The parameters of the call.
+
+        Returns
+        -------
+        dict
+            The decoded JSON-RPC response.
+        """
+        self.logger.debug(f"Making request HTTP. URI: {self.endpoint_uri}, Method: {method}")
+        payload = {"jsonrpc": "2.0", "method": method, "params": params, "id": next(self.request_counter)}
+        response = await self._get_client().post(
+            self.endpoint_uri,
+            content=orjson.dumps(payload, default=_encode_default),
+            **dict(self.get_request_kwargs())
+        )
+        response.raise_for_status()
+        decoded_response = orjson.loads(response.content)
+        self.logger.debug(f"Getting response HTTP. URI: {self.endpoint_uri}, Method: {method}, "
+                          f"Response: {decoded_response}")
+        return decoded_response
+
+    async def disconnect(self) -> None:
+        """
+        Closes the underlying HTTP client. A new one is opened on the next request.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -1,6 +1,8 @@
 import asyncio
-import json
+import sys
 import time
+import orjson
+from decimal import Decimal
 from typing import Any, Dict, List, Tuple
 from fetch_balances import AsyncBalanceFetcher
 
@@ -12,18 +14,35 @@ NODE_URL = """https://rpc.ankr.com/eth"""
 
 DELAY = 0.3  # in seconds
 """float:
-    Delay between asynchronous wallet parsing tasks. It is recommended to set it to about 2-3 seconds if you are 
-    using a free node with low request limits.
+    Minimum interval between the starts of asynchronous wallet parsing tasks. It is recommended to set it to about 
+    2-3 seconds if you are using a free node with low request limits.
 """
 
-ERC20_ABI = '[{"constant":true,"inputs":[],"name":"name","outputs":[{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"guy","type":"address"},{"name":"wad","type":"uint256"}],"name":"approve","outputs":[{"name":"","type":"bool"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"totalSupply","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"src","type":"address"},{"name":"dst","type":"address"},{"name":"wad","type":"uint256"}],"name":"transferFrom","outputs":[{"name":"","type":"bool"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"wad","type":"uint256"}],"name":"withdraw","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"decimals","outputs":[{"name":"","type":"uint8"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[{"name":"","type":"address"}],"name":"balanceOf","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[],"name":"symbol","outputs":[{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"dst","type":"address"},{"name":"wad","type":"uint256"}],"name":"transfer","outputs":[{"name":"","type":"bool"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[],"name":"deposit","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":true,"inputs":[],"name":"allowance","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"payable":true,"stateMutability":"payable","type":"fallback"},{"anonymous":false,"inputs":[{"indexed":true,"name":"src","type":"address"},{"indexed":true,"name":"guy","type":"address"},{"indexed":false,"name":"wad","type":"uint256"}],"name":"Approval","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"name":"src","type":"address"},{"indexed":true,"name":"dst","type":"address"},{"indexed":false,"name":"wad","type":"uint256"}],"name":"Transfer","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"name":"dst","type":"address"},{"indexed":false,"name":"wad","type":"uint256"}],"name":"Deposit","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"name":"src","type":"address"},{"indexed":false,"name":"wad","type":"uint256"}],"name":"Withdrawal","type":"event"}]'
-"""str:
-    This is the ABI (set of instructions) for interacting with ERC20 token contracts. It includes all the necessary 
-    methods that may be needed for this project. You won't need anything more, but if you want to modify the project, 
-    you are free to do so.
+MAX_CONCURRENT = 10
+"""int:
+    Maximum number of wallets parsed at the same time. Lower it if your node rejects bursts of parallel requests.
 """
 
 
+def _encode_decimal(value: Any) -> str:
+    """
+    Serializes Decimal balances as plain decimal strings so that no precision is lost in the output.
+
+    Parameters
+    ----------
+    value : Any
+        The value orjson could not serialize natively.
+
+    Returns
+    -------
+    str
+        The balance written out in fixed-point notation.
+    """
+    if isinstance(value, Decimal):
+        return format(value, "f")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 async def main() -> Tuple[List[Dict[str, Any]], float]:
     """
     Main function to fetch balances and measure execution time.
@@ -52,14 +71,19 @@ async def main() -> Tuple[List[Dict[str, Any]], float]:
         do not need to provide its address in this list.)
     """
 
-    fetcher = AsyncBalanceFetcher(NODE_URL, DELAY, ERC20_ABI)
+    fetcher = AsyncBalanceFetcher(NODE_URL, DELAY, MAX_CONCURRENT)
 
-    start_time = time.time()
-    balances = await fetcher.fetch_all_balances(wallet_addresses, token_addresses)
-    end_time = time.time()
-    elapsed_time = end_time - start_time
+    start_time = time.perf_counter()
+    try:
+        balances = await fetcher.fetch_all_balances(wallet_addresses, token_addresses)
+    finally:
+        await fetcher.close()
+    elapsed_time = time.perf_counter() - start_time
 
-    print(json.dumps(balances, indent=2))
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(balances, default=_encode_decimal,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
     print(f"Execution time: {elapsed_time:.2f} seconds")
 
     return balances, elapsed_time
@@ -1,7 +1,195 @@
+import asyncio
+from decimal import Context, Decimal
 from error_handling import ErrorHandler
-from web3 import Web3, AsyncHTTPProvider
+from functools import lru_cache
+from eth_abi import decode
+from http_provider import HttpxAsyncProvider
+from web3 import Web3
 from web3.eth import AsyncEth
-from typing import Tuple, Union
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+"""bytes: Selector of the ERC20 balanceOf(address) function."""
+
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")
+"""bytes: Selector of the ERC20 decimals() function."""
+
+SYMBOL_SELECTOR = bytes.fromhex("95d89b41")
+"""bytes: Selector of the ERC20 symbol() function."""
+
+GET_ETH_BALANCE_SELECTOR = bytes.fromhex("4d2301cc")
+"""bytes: Selector of the Multicall3 getEthBalance(address) function."""
+
+ERROR_STRING_SELECTOR = bytes.fromhex("08c379a0")
+"""bytes: Selector of the Error(string) payload that Solidity reverts with."""
+
+_UINT256_CONTEXT = Context(prec=78)
+"""Context: Decimal context wide enough to hold any uint256 value exactly."""
+
+KNOWN_TOKENS = {
+    1: {
+        "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2": (18, "WETH"),
+        "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48": (6, "USDC"),
+        "0xdac17f958d2ee523a2206206994597c13d831ec7": (6, "USDT"),
+        "0x6b175474e89094c44da98b954eedeac495271d0f": (18, "DAI"),
+        "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599": (8, "WBTC"),
+        "0x514910771af9ca656af840dff83e8264ecf986ca": (18, "LINK"),
+        "0x1f9840a85d5af5bf1d1762f925bdaddc4201f984": (18, "UNI"),
+    },
+}
+"""dict:
+    Decimals and symbols of widely used tokens, keyed by chain ID and lowercase token address. Their metadata is 
+    immutable, so it does not have to be requested from the node.
+"""
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+"""str:
+    Address of the Multicall3 contract, deployed at the same address on most EVM networks.
+"""
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+"""list:
+    The subset of the Multicall3 ABI used to batch balance calls.
+"""
+
+
+@lru_cache(maxsize=4096)
+def checksum_address(address: str) -> str:
+    """
+    Converts an address to its checksummed form, caching the result since the same wallet and token addresses are 
+    checksummed over and over.
+
+    Parameters
+    ----------
+    address : str
+        The address to checksum.
+
+    Returns
+    -------
+    str
+        The checksummed address.
+    """
+    return Web3.to_checksum_address(address)
+
+
+def to_units(raw_balance: int, decimals: int) -> Decimal:
+    """
+    Converts a raw integer balance to token units exactly, without going through a float.
+
+    Parameters
+    ----------
+    raw_balance : int
+        The balance in the smallest token denomination.
+    decimals : int
+        The number of decimals of the token.
+
+    Returns
+    -------
+    Decimal
+        The balance in token units.
+    """
+    return Decimal(raw_balance).scaleb(-decimals, _UINT256_CONTEXT)
+
+
+def get_known_token_metadata(chain_id: int, token_address: str) -> Optional[Tuple[int, str]]:
+    """
+    Looks up the decimals and symbol of a token in the built-in registry.
+
+    Parameters
+    ----------
+    chain_id : int
+        The ID of the chain the token is deployed on.
+    token_address : str
+        The address of the custom token contract.
+
+    Returns
+    -------
+    tuple or None
+        A tuple containing the token decimals and symbol, or None if the token is not in the registry.
+    """
+    return KNOWN_TOKENS.get(chain_id, {}).get(token_address.lower())
+
+
+def encode_address_call(selector: bytes, address: str) -> bytes:
+    """
+    Encodes the calldata of a function taking a single address argument.
+
+    Parameters
+    ----------
+    selector : bytes
+        The 4-byte selector of the function.
+    address : str
+        The checksummed address passed as the argument.
+
+    Returns
+    -------
+    bytes
+        The selector followed by the address left-padded to 32 bytes.
+    """
+    return selector + bytes.fromhex(address[2:]).rjust(32, b"\x00")
+
+
+@lru_cache(maxsize=None)
+def get_web3(node_url: str) -> Web3:
+    """
+    Gets the Web3 instance for a node URL, creating it on first use so that every reader in the process shares one 
+    provider and its HTTP/2 connection to the node.
+
+    Parameters
+    ----------
+    node_url : str
+        The URL of the Ethereum node to connect to.
+
+    Returns
+    -------
+    Web3
+        The Web3 instance connected to the node.
+    """
+    web3 = Web3(HttpxAsyncProvider(node_url))
+    web3.eth = AsyncEth(web3)
+    return web3
+
+
+_OPEN_READERS: Dict[str, int] = {}
+"""dict:
+    Number of open BalanceReader instances per node URL. The shared provider is only disconnected once the last 
+    reader using it is closed.
+"""
 
 
 class BalanceReader:
@@ -10,12 +198,22 @@ class BalanceReader:
 
     Attributes
     ----------
+    node_url : str
+        The URL of the Ethereum node to connect to.
     web3 : Web3
         The Web3 instance connected to an Ethereum node.
+    provider : HttpxAsyncProvider
+        The HTTP provider the Web3 instance sends requests through.
 
     Methods
     -------
-    get_custom_token_balance(token_address, token_abi, wallet_address):
+    close():
+        Releases this reader's use of the shared connection to the node.
+
+    get_chain_id():
+        Gets the ID of the connected chain.
+
+    get_custom_token_balance(token_address, wallet_address):
         Gets the balance of a custom token for a given wallet address.
 
     get_native_token_balance(wallet_address):
@@ -31,11 +229,104 @@ class BalanceReader:
         node_url : str
             The URL of the Ethereum node to connect to.
         """
-        self.web3 = Web3(AsyncHTTPProvider(node_url))
-        self.web3.eth = AsyncEth(self.web3)
+        self.node_url = node_url
+        self.web3 = get_web3(node_url)
+        self.provider = self.web3.provider
+        self._closed = False
+        _OPEN_READERS[node_url] = _OPEN_READERS.get(node_url, 0) + 1
+        self._meta_cache: Dict[str, Tuple[int, str]] = {}
+        self._meta_locks: Dict[str, asyncio.Lock] = {}
+        self._chain_id: Optional[int] = None
+        self._chain_id_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """
+        Releases this reader's use of the shared connection to the node. The connection is closed once no other 
+        reader for the same node URL is still open. Calling it again is a no-op.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        _OPEN_READERS[self.node_url] -= 1
+        if _OPEN_READERS[self.node_url] == 0:
+            del _OPEN_READERS[self.node_url]
+            await self.provider.disconnect()
+
+    async def get_chain_id(self) -> int:
+        """
+        Gets the ID of the connected chain, querying the node only once.
+
+        Returns
+        -------
+        int
+            The chain ID.
+        """
+        if self._chain_id is None:
+            async with self._chain_id_lock:
+                if self._chain_id is None:
+                    self._chain_id = await self.web3.eth.chain_id
+        return self._chain_id
+
+    async def _call(self, checksum_token_address: str, call_data: bytes) -> bytes:
+        """
+        Executes a view call against a token contract with pre-encoded calldata.
 
-    async def get_custom_token_balance(self, token_address: str, token_abi: str, wallet_address: str) -> Tuple[
-        Union[float, None], Union[str, None], Union[str, None], Union[str, None]]:
+        Parameters
+        ----------
+        checksum_token_address : str
+            The checksummed address of the custom token contract.
+        call_data : bytes
+            The encoded calldata.
+
+        Returns
+        -------
+        bytes
+            The raw return data.
+
+        Raises
+        ------
+        BadFunctionCallOutput
+            If the call returned less than one 32-byte ABI word.
+        """
+        result = await self.web3.eth.call({"to": checksum_token_address, "data": "0x" + call_data.hex()})
+        if len(result) < 32:
+            raise BadFunctionCallOutput(f"Could not call contract function at {checksum_token_address}, "
+                                        f"is contract deployed correctly and chain synced?")
+        return result
+
+    async def _get_token_metadata(self, checksum_token_address: str) -> Tuple[int, str]:
+        """
+        Gets the decimals and symbol of a token, querying the node only once per token and not at all for tokens in 
+        the built-in registry.
+
+        Parameters
+        ----------
+        checksum_token_address : str
+            The checksummed address of the custom token contract.
+
+        Returns
+        -------
+        tuple
+            A tuple containing the token decimals and symbol.
+        """
+        meta = self._meta_cache.get(checksum_token_address)
+        if meta is None:
+            lock = self._meta_locks.setdefault(checksum_token_address, asyncio.Lock())
+            async with lock:
+                meta = self._meta_cache.get(checksum_token_address)
+                if meta is None:
+                    meta = get_known_token_metadata(await self.get_chain_id(), checksum_token_address)
+                if meta is None:
+                    decimals_result, symbol_result = await asyncio.gather(
+                        self._call(checksum_token_address, DECIMALS_SELECTOR),
+                        self._call(checksum_token_address, SYMBOL_SELECTOR)
+                    )
+                    meta = (int.from_bytes(decimals_result[:32], "big"), decode(["string"], symbol_result)[0])
+                self._meta_cache[checksum_token_address] = meta
+        return meta
+
+    async def get_custom_token_balance(self, token_address: str, wallet_address: str) -> Tuple[
+        Union[Decimal, None], Union[str, None], Union[str, None], Union[str, None]]:
         """
         Gets the balance of a custom token for a given wallet address.
 
@@ -43,8 +334,6 @@ class BalanceReader:
         ----------
         token_address : str
             The address of the custom token contract.
-        token_abi : str
-            The ABI of the custom token contract.
         wallet_address : str
             The wallet address to check the balance for.
 
@@ -54,15 +343,15 @@ class BalanceReader:
             A tuple containing the balance, token symbol, error type, and error message.
         """
         try:
-            checksum_wallet_address = self.web3.to_checksum_address(wallet_address)
-            checksum_token_address = self.web3.to_checksum_address(token_address)
+            checksum_wallet_address = checksum_address(wallet_address)
+            checksum_token_address = checksum_address(token_address)
 
-            token_contract = self.web3.eth.contract(address=checksum_token_address, abi=token_abi)
-
-            balance_of_token = await token_contract.functions.balanceOf(checksum_wallet_address).call()
-            token_decimals = await token_contract.functions.decimals().call()
-            ether_balance = balance_of_token / 10 ** token_decimals
-            token_symbol = await token_contract.functions.symbol().call()
+            balance_result, (token_decimals, token_symbol) = await asyncio.gather(
+                self._call(checksum_token_address, encode_address_call(BALANCE_OF_SELECTOR, checksum_wallet_address)),
+                self._get_token_metadata(checksum_token_address)
+            )
+            balance_of_token = int.from_bytes(balance_result[:32], "big")
+            ether_balance = to_units(balance_of_token, token_decimals)
 
             return ether_balance, token_symbol, None, None
 
@@ -72,7 +361,7 @@ class BalanceReader:
             return None, None, error_type, error_message
 
     async def get_native_token_balance(self, wallet_address: str) -> Tuple[
-        Union[float, None], Union[str, None], Union[str, None]]:
+        Union[Decimal, None], Union[str, None], Union[str, None]]:
         """
         Gets the balance of the native token (ETH) for a given wallet address.
 
@@ -87,11 +376,121 @@ class BalanceReader:
             A tuple containing the balance, error type, and error message.
         """
         try:
-            checksum_wallet_address = self.web3.to_checksum_address(wallet_address)
+            checksum_wallet_address = checksum_address(wallet_address)
             balance = await self.web3.eth.get_balance(checksum_wallet_address)
-            return balance / 10 ** 18, None, None
+            return to_units(balance, 18), None, None
 
         except Exception as e:
             error_type = ErrorHandler.classify_error(e)
             error_message = ErrorHandler.get_error_message(e)
             return None, error_type, error_message
+
+
+class MulticallReader:
+    """
+    A class to batch many contract view calls into a single eth_call through the Multicall3 contract.
+
+    Attributes
+    ----------
+    web3 : Web3
+        The Web3 instance connected to an Ethereum node.
+    chunk_size : int
+        The maximum number of calls submitted in a single aggregate3 request.
+
+    Methods
+    -------
+    is_available():
+        Checks whether Multicall3 is deployed on the connected chain.
+
+    aggregate(calls):
+        Executes a batch of calls in a single eth_call.
+
+    decode(result, output_type):
+        Decodes the return data of a single call.
+    """
+
+    def __init__(self, web3: Web3, chunk_size: int = 500) -> None:
+        """
+        Initializes the MulticallReader with a Web3 instance and chunk size.
+
+        Parameters
+        ----------
+        web3 : Web3
+            The Web3 instance connected to an Ethereum node.
+        chunk_size : int, optional
+            The maximum number of calls submitted in a single aggregate3 request (default is 500).
+        """
+        self.web3 = web3
+        self.chunk_size = chunk_size
+        self.multicall = self.web3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        self._available = None
+
+    async def is_available(self) -> bool:
+        """
+        Checks whether Multicall3 is deployed on the connected chain.
+
+        Returns
+        -------
+        bool
+            True if the Multicall3 contract has code on the connected chain.
+        """
+        if self._available is None:
+            code = await self.web3.eth.get_code(MULTICALL3_ADDRESS)
+            self._available = len(code) > 0
+        return self._available
+
+    async def aggregate(self, calls: List[Tuple[str, bytes]]) -> List[Tuple[bool, bytes]]:
+        """
+        Executes a batch of calls in a single eth_call. Failing calls do not revert the batch.
+
+        Parameters
+        ----------
+        calls : list of tuple
+            A list of (target address, calldata) pairs.
+
+        Returns
+        -------
+        list of tuple
+            A list of (success, return data) pairs in the order of the submitted calls.
+        """
+        return await self.multicall.functions.aggregate3(
+            [(target, True, call_data) for target, call_data in calls]
+        ).call()
+
+    @staticmethod
+    def decode(result: Tuple[bool, bytes], output_type: str) -> Any:
+        """
+        Decodes the return data of a single call.
+
+        Parameters
+        ----------
+        result : tuple
+            The (success, return data) pair returned by aggregate3.
+        output_type : str
+            The ABI type of the returned value.
+
+        Returns
+        -------
+        Any
+            The decoded value.
+
+        Raises
+        ------
+        ContractLogicError
+            If the call reverted, matching what web3.py raises for a reverted eth_call.
+        BadFunctionCallOutput
+            If the call succeeded but returned less than one 32-byte ABI word.
+        """
+        success, return_data = result
+        if not success:
+            message = "execution reverted"
+            if return_data[:4] == ERROR_STRING_SELECTOR:
+                try:
+                    message = f"{message}: {decode(['string'], return_data[4:])[0]}"
+                except Exception:
+                    pass
+            raise ContractLogicError(message, data="0x" + bytes(return_data).hex())
+        if len(return_data) < 32:
+            raise BadFunctionCallOutput("Could not decode contract function call: the call returned no data, "
+                                        "is contract deployed correctly and chain synced?")
+        return decode([output_type], return_data)[0]